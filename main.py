@@ -7,6 +7,9 @@ Bridges CAN bus telemetry with Qt/QML UI using signal/slot architecture.
 import sys
 import os
 import argparse
+import copy
+import math
+import threading
 from pathlib import Path
 
 # Set Qt Quick Controls style BEFORE importing Qt
@@ -17,9 +20,9 @@ os.environ['QT_QUICK_CONTROLS_STYLE'] = 'Basic'
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-from PySide6.QtCore import QObject, Signal, QTimer, QUrl, Slot, Property
+from PySide6.QtCore import QObject, Signal, QTimer, QUrl, Slot
 from PySide6.QtGui import QGuiApplication
-from PySide6.QtQml import qmlRegisterType, QQmlApplicationEngine
+from PySide6.QtQml import qmlRegisterType, QQmlApplicationEngine, QQmlPropertyMap
 
 from middleware.can_manager import CANManager
 from middleware.vesc_codec import VESCCodec, VESCStatus
@@ -29,27 +32,56 @@ from mock.simulator import VESCSimulator
 class TelemetryBridge(QObject):
     """
     Bridge between CAN middleware and QML UI.
-    Exposes telemetry data as Qt properties for QML binding.
+    Exposes telemetry data through a QQmlPropertyMap for QML binding.
     """
     
-    # Signals for QML
-    speedChanged = Signal(float)
-    rpmChanged = Signal(int)
-    voltageChanged = Signal(float)
-    currentMotorChanged = Signal(float)
-    currentBatteryChanged = Signal(float)
-    powerChanged = Signal(float)
-    tempMosChanged = Signal(float)
-    tempMotorChanged = Signal(float)
-    dutyCycleChanged = Signal(float)
-    efficiencyChanged = Signal(float)
-    ampHoursConsumedChanged = Signal(float)
-    ampHoursChargedChanged = Signal(float)
-    wattHoursConsumedChanged = Signal(float)
-    wattHoursChargedChanged = Signal(float)
-    tachometerChanged = Signal(int)
-    tachometerAbsChanged = Signal(int)
-    faultCodeChanged = Signal(int)
+    # Fixed-offset storage for the state touched on every update. (PySide's
+    # QObject wrapper still provides a __dict__ for its signal instances.)
+    __slots__ = (
+        '_speed', '_rpm', '_voltage', '_current_motor', '_current_battery',
+        '_power', '_temp_mos', '_temp_motor', '_duty_cycle', '_efficiency',
+        '_amp_hours_consumed', '_amp_hours_charged', '_watt_hours_consumed',
+        '_watt_hours_charged', '_tachometer', '_tachometer_abs', '_fault_code',
+        '_telemetry_map', 'codec', '_status', '_last_status', '_skipped_fields',
+        '_last_payload', '_dirty_fields', '_pending_fields',
+        '_pending_lock', '_update_timer', '_wheel_diameter_m', '_gear_ratio',
+        'motor_kv', '_rpm_to_kmh',
+    )
+    
+    # Emitted once per update batch, after all changed fields are published
+    telemetryChanged = Signal()
+    
+    # (state attribute, VESCStatus field, property map key) for every value
+    # copied straight from the merged status. Speed is derived separately.
+    _FIELDS = (
+        ("_rpm", "rpm", "rpm"),
+        ("_voltage", "voltage", "voltage"),
+        ("_current_motor", "current_motor", "currentMotor"),
+        ("_current_battery", "current_battery", "currentBattery"),
+        ("_power", "power", "power"),
+        ("_temp_mos", "temp_mos", "tempMos"),
+        ("_temp_motor", "temp_motor", "tempMotor"),
+        ("_duty_cycle", "duty_cycle", "dutyCycle"),
+        ("_efficiency", "efficiency", "efficiency"),
+        ("_amp_hours_consumed", "amp_hours_consumed", "ampHoursConsumed"),
+        ("_amp_hours_charged", "amp_hours_charged", "ampHoursCharged"),
+        ("_watt_hours_consumed", "watt_hours_consumed", "wattHoursConsumed"),
+        ("_watt_hours_charged", "watt_hours_charged", "wattHoursCharged"),
+        ("_tachometer", "tachometer", "tachometer"),
+        ("_tachometer_abs", "tachometer_abs", "tachometerAbs"),
+        ("_fault_code", "fault_code", "faultCode"),
+    )
+    
+    # VESCStatus fields each status frame can change. Power and efficiency
+    # are derived from the current (STATUS) and voltage (STATUS_2) frames.
+    _FRAME_FIELDS = {
+        VESCCodec.CAN_PACKET_STATUS: ("temp_mos", "current_motor", "current_battery",
+                                      "duty_cycle", "power", "efficiency"),
+        VESCCodec.CAN_PACKET_STATUS_2: ("rpm", "voltage", "power", "efficiency"),
+        VESCCodec.CAN_PACKET_STATUS_3: ("amp_hours_consumed", "amp_hours_charged"),
+        VESCCodec.CAN_PACKET_STATUS_4: ("watt_hours_consumed", "watt_hours_charged"),
+        VESCCodec.CAN_PACKET_STATUS_5: ("tachometer", "tachometer_abs"),
+    }
     
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -73,284 +105,141 @@ class TelemetryBridge(QObject):
         self._tachometer_abs = 0
         self._fault_code = 0
         
+        # Property map exposed to QML - keys become bindable properties
+        # (e.g. telemetry.speed), so QML only re-evaluates changed fields
+        self._telemetry_map = QQmlPropertyMap(self)
+        self._telemetry_map.insert("speed", self._speed)
+        for attr, _, key in self._FIELDS:
+            self._telemetry_map.insert(key, getattr(self, attr))
+        
         # VESC decoder
         self.codec = VESCCodec()
         
-        # Status frame cache for merging multi-frame packets
-        self.status_cache = {}
-        
-        # Motor parameters for speed calculation
-        self.wheel_diameter_m = 0.330  # 13" wheel ≈ 0.33m diameter
-        self.gear_ratio = 1.0  # Direct drive (adjust if geared)
-        self.motor_kv = 130  # 130KV motor
-        
-    def update_from_status(self, status: VESCStatus):
-        """Update all telemetry properties from VESCStatus"""
-        # Calculate speed from RPM
-        # Speed (km/h) = (RPM / gear_ratio) * wheel_circumference * 60 / 1000
-        wheel_circumference = 3.14159 * self.wheel_diameter_m
-        speed_ms = (status.rpm / self.gear_ratio) * wheel_circumference / 60.0
-        
-        # Update properties - need to check for changes and emit signals manually
-        new_speed = speed_ms * 3.6
-        if self._speed != new_speed:
-            self._speed = new_speed
-            self.speedChanged.emit(new_speed)
-        
-        if self._rpm != status.rpm:
-            self._rpm = status.rpm
-            self.rpmChanged.emit(status.rpm)
-        
-        if self._voltage != status.voltage:
-            self._voltage = status.voltage
-            self.voltageChanged.emit(status.voltage)
-        
-        if self._current_motor != status.current_motor:
-            self._current_motor = status.current_motor
-            self.currentMotorChanged.emit(status.current_motor)
-        
-        if self._current_battery != status.current_battery:
-            self._current_battery = status.current_battery
-            self.currentBatteryChanged.emit(status.current_battery)
-        
-        if self._power != status.power:
-            self._power = status.power
-            self.powerChanged.emit(status.power)
-        
-        if self._temp_mos != status.temp_mos:
-            self._temp_mos = status.temp_mos
-            self.tempMosChanged.emit(status.temp_mos)
+        # Single status buffer every frame is decoded into; each frame only
+        # overwrites its own fields, so it always holds the merged telemetry
+        self._status = VESCStatus()
         
-        if self._temp_motor != status.temp_motor:
-            self._temp_motor = status.temp_motor
-            self.tempMotorChanged.emit(status.temp_motor)
+        # Last status published to QML, and fields of statuses skipped since
+        # then because they matched it at display precision
+        self._last_status = None
+        self._skipped_fields = set()
         
-        if self._duty_cycle != status.duty_cycle:
-            self._duty_cycle = status.duty_cycle
-            self.dutyCycleChanged.emit(status.duty_cycle)
+        # Last raw payload per CAN ID, so repeated identical frames are skipped
+        self._last_payload = {}
         
-        if self._efficiency != status.efficiency:
-            self._efficiency = status.efficiency
-            self.efficiencyChanged.emit(status.efficiency)
+        # Fields touched since the last publish; the update timer pushes them
+        # to QML at display rate (CAN callbacks arrive on background threads,
+        # faster than the UI can show them)
+        self._pending_fields = set()
+        self._pending_lock = threading.Lock()
+        self._update_timer = QTimer(self)
+        self._update_timer.setInterval(16)  # ~60 FPS
+        self._update_timer.timeout.connect(self._flush_updates)
+        self._update_timer.start()
         
-        if self._amp_hours_consumed != status.amp_hours_consumed:
-            self._amp_hours_consumed = status.amp_hours_consumed
-            self.ampHoursConsumedChanged.emit(status.amp_hours_consumed)
+        # _FIELDS entries affected by each status frame
+        self._dirty_fields = {
+            can_id: tuple(field for field in self._FIELDS if field[1] in names)
+            for can_id, names in self._FRAME_FIELDS.items()
+        }
         
-        if self._amp_hours_charged != status.amp_hours_charged:
-            self._amp_hours_charged = status.amp_hours_charged
-            self.ampHoursChargedChanged.emit(status.amp_hours_charged)
-        
-        if self._watt_hours_consumed != status.watt_hours_consumed:
-            self._watt_hours_consumed = status.watt_hours_consumed
-            self.wattHoursConsumedChanged.emit(status.watt_hours_consumed)
+        # Motor parameters for speed calculation
+        self._wheel_diameter_m = 0.330  # 13" wheel ≈ 0.33m diameter
+        self._gear_ratio = 1.0  # Direct drive (adjust if geared)
+        self.motor_kv = 130  # 130KV motor
+        self._update_speed_factor()
+    
+    def _update_speed_factor(self):
+        """Fold the constant RPM -> km/h conversion into one multiplier"""
+        # Speed (km/h) = (RPM / gear_ratio) * wheel_circumference / 60 * 3.6
+        self._rpm_to_kmh = math.pi * self._wheel_diameter_m / self._gear_ratio / 60.0 * 3.6
+        # Speed depends on this factor, so the next status must be published
+        self._last_status = None
+    
+    @property
+    def wheel_diameter_m(self) -> float:
+        return self._wheel_diameter_m
+    
+    @wheel_diameter_m.setter
+    def wheel_diameter_m(self, value: float):
+        self._wheel_diameter_m = value
+        self._update_speed_factor()
+    
+    @property
+    def gear_ratio(self) -> float:
+        return self._gear_ratio
+    
+    @gear_ratio.setter
+    def gear_ratio(self, value: float):
+        self._gear_ratio = value
+        self._update_speed_factor()
+    
+    @property
+    def telemetry_map(self) -> QQmlPropertyMap:
+        """Property map to expose to QML as the "telemetry" context property"""
+        return self._telemetry_map
+    
+    def update_from_status(self, status: VESCStatus, fields=None):
+        """
+        Update telemetry properties from VESCStatus
         
-        if self._watt_hours_charged != status.watt_hours_charged:
-            self._watt_hours_charged = status.watt_hours_charged
-            self.wattHoursChargedChanged.emit(status.watt_hours_charged)
+        Args:
+            status: Merged VESCStatus
+            fields: Iterable of _FIELDS entries to check (default: all fields)
+        """
+        # Nothing visible changed since the last publish - skip the whole
+        # batch, but remember its fields so small drifts are still published
+        if status == self._last_status:
+            if fields is not None:
+                self._skipped_fields.update(fields)
+            return
+        if fields is not None and self._skipped_fields:
+            fields = self._skipped_fields.union(fields)
+        self._skipped_fields = set()
+        self._last_status = copy.copy(status)
         
-        if self._tachometer != status.tachometer:
-            self._tachometer = status.tachometer
-            self.tachometerChanged.emit(status.tachometer)
+        # Collect changed fields, then publish them as a single batch
+        changed = {}
+        new_speed = status.rpm * self._rpm_to_kmh
+        if self._speed != new_speed:
+            self._speed = new_speed
+            changed["speed"] = new_speed
         
-        if self._tachometer_abs != status.tachometer_abs:
-            self._tachometer_abs = status.tachometer_abs
-            self.tachometerAbsChanged.emit(status.tachometer_abs)
+        for attr, status_attr, key in (self._FIELDS if fields is None else fields):
+            value = getattr(status, status_attr)
+            if getattr(self, attr) != value:
+                setattr(self, attr, value)
+                changed[key] = value
         
-        if self._fault_code != status.fault_code:
-            self._fault_code = status.fault_code
-            self.faultCodeChanged.emit(status.fault_code)
-    
-    # Property getters/setters with signals
-    @Property(float, notify=speedChanged)
-    def speed(self):
-        return self._speed
-    
-    @speed.setter
-    def speed(self, value):
-        if self._speed != value:
-            self._speed = value
-            self.speedChanged.emit(value)
-    
-    @Property(int, notify=rpmChanged)
-    def rpm(self):
-        return self._rpm
-    
-    @rpm.setter
-    def rpm(self, value):
-        if self._rpm != value:
-            self._rpm = value
-            self.rpmChanged.emit(value)
-    
-    @Property(float, notify=voltageChanged)
-    def voltage(self):
-        return self._voltage
-    
-    @voltage.setter
-    def voltage(self, value):
-        if self._voltage != value:
-            self._voltage = value
-            self.voltageChanged.emit(value)
-    
-    @Property(float, notify=currentMotorChanged)
-    def currentMotor(self):
-        return self._current_motor
-    
-    @currentMotor.setter
-    def currentMotor(self, value):
-        if self._current_motor != value:
-            self._current_motor = value
-            self.currentMotorChanged.emit(value)
-    
-    @Property(float, notify=currentBatteryChanged)
-    def currentBattery(self):
-        return self._current_battery
-    
-    @currentBattery.setter
-    def currentBattery(self, value):
-        if self._current_battery != value:
-            self._current_battery = value
-            self.currentBatteryChanged.emit(value)
-    
-    @Property(float, notify=powerChanged)
-    def power(self):
-        return self._power
-    
-    @power.setter
-    def power(self, value):
-        if self._power != value:
-            self._power = value
-            self.powerChanged.emit(value)
-    
-    @Property(float, notify=tempMosChanged)
-    def tempMos(self):
-        return self._temp_mos
-    
-    @tempMos.setter
-    def tempMos(self, value):
-        if self._temp_mos != value:
-            self._temp_mos = value
-            self.tempMosChanged.emit(value)
-    
-    @Property(float, notify=tempMotorChanged)
-    def tempMotor(self):
-        return self._temp_motor
-    
-    @tempMotor.setter
-    def tempMotor(self, value):
-        if self._temp_motor != value:
-            self._temp_motor = value
-            self.tempMotorChanged.emit(value)
-    
-    @Property(float, notify=dutyCycleChanged)
-    def dutyCycle(self):
-        return self._duty_cycle
-    
-    @dutyCycle.setter
-    def dutyCycle(self, value):
-        if self._duty_cycle != value:
-            self._duty_cycle = value
-            self.dutyCycleChanged.emit(value)
-    
-    @Property(float, notify=efficiencyChanged)
-    def efficiency(self):
-        return self._efficiency
-    
-    @efficiency.setter
-    def efficiency(self, value):
-        if self._efficiency != value:
-            self._efficiency = value
-            self.efficiencyChanged.emit(value)
-    
-    @Property(float, notify=ampHoursConsumedChanged)
-    def ampHoursConsumed(self):
-        return self._amp_hours_consumed
-    
-    @ampHoursConsumed.setter
-    def ampHoursConsumed(self, value):
-        if self._amp_hours_consumed != value:
-            self._amp_hours_consumed = value
-            self.ampHoursConsumedChanged.emit(value)
-    
-    @Property(float, notify=ampHoursChargedChanged)
-    def ampHoursCharged(self):
-        return self._amp_hours_charged
-    
-    @ampHoursCharged.setter
-    def ampHoursCharged(self, value):
-        if self._amp_hours_charged != value:
-            self._amp_hours_charged = value
-            self.ampHoursChargedChanged.emit(value)
-    
-    @Property(float, notify=wattHoursConsumedChanged)
-    def wattHoursConsumed(self):
-        return self._watt_hours_consumed
-    
-    @wattHoursConsumed.setter
-    def wattHoursConsumed(self, value):
-        if self._watt_hours_consumed != value:
-            self._watt_hours_consumed = value
-            self.wattHoursConsumedChanged.emit(value)
-    
-    @Property(float, notify=wattHoursChargedChanged)
-    def wattHoursCharged(self):
-        return self._watt_hours_charged
-    
-    @wattHoursCharged.setter
-    def wattHoursCharged(self, value):
-        if self._watt_hours_charged != value:
-            self._watt_hours_charged = value
-            self.wattHoursChargedChanged.emit(value)
-    
-    @Property(int, notify=tachometerChanged)
-    def tachometer(self):
-        return self._tachometer
-    
-    @tachometer.setter
-    def tachometer(self, value):
-        if self._tachometer != value:
-            self._tachometer = value
-            self.tachometerChanged.emit(value)
-    
-    @Property(int, notify=tachometerAbsChanged)
-    def tachometerAbs(self):
-        return self._tachometer_abs
-    
-    @tachometerAbs.setter
-    def tachometerAbs(self, value):
-        if self._tachometer_abs != value:
-            self._tachometer_abs = value
-            self.tachometerAbsChanged.emit(value)
-    
-    @Property(int, notify=faultCodeChanged)
-    def faultCode(self):
-        return self._fault_code
-    
-    @faultCode.setter
-    def faultCode(self, value):
-        if self._fault_code != value:
-            self._fault_code = value
-            self.faultCodeChanged.emit(value)
+        if changed:
+            for key, value in changed.items():
+                self._telemetry_map.insert(key, value)
+            self.telemetryChanged.emit()
     
     @Slot(int, bytes)
     def on_can_message(self, can_id: int, data: bytes):
         """Handle incoming CAN message"""
-        status = self.codec.decode_status_frame(can_id, data)
-        if status:
-            # Cache this status frame
-            self.status_cache[can_id] = status
-            
-            # Try to merge all available status frames
-            frames = [
-                self.status_cache.get(VESCCodec.CAN_PACKET_STATUS),
-                self.status_cache.get(VESCCodec.CAN_PACKET_STATUS_2),
-                self.status_cache.get(VESCCodec.CAN_PACKET_STATUS_3),
-                self.status_cache.get(VESCCodec.CAN_PACKET_STATUS_4),
-                self.status_cache.get(VESCCodec.CAN_PACKET_STATUS_5),
-            ]
-            
-            merged = self.codec.merge_status_frames(*frames)
-            self.update_from_status(merged)
+        # Identical payload to the last frame with this ID - nothing changed
+        if self._last_payload.get(can_id) == data:
+            return
+        
+        with self._pending_lock:
+            if not self.codec.decode_into(can_id, data, self._status):
+                return
+            self._pending_fields.update(self._dirty_fields[can_id])
+        self._last_payload[can_id] = bytes(data)
+    
+    @Slot()
+    def _flush_updates(self):
+        """Publish the latest merged status, if any arrived since the last tick"""
+        with self._pending_lock:
+            fields = self._pending_fields
+            if not fields:
+                return
+            # Snapshot, so CAN threads can keep decoding while we publish
+            status = copy.copy(self._status)
+            self._pending_fields = set()
+        self.update_from_status(status, fields)
 
 
 def main():
@@ -380,12 +269,10 @@ def main():
         can_manager.connect()
         
         # Create and start simulator
-        simulator = VESCSimulator(callback=lambda can_id, data: 
-                                  telemetry.on_can_message(can_id, data))
+        simulator = VESCSimulator(callback=telemetry.on_can_message)
         simulator.set_throttle(args.sim_throttle)
         
         # Start simulator in background thread
-        import threading
         sim_thread = threading.Thread(target=simulator.start, daemon=True)
         sim_thread.start()
         
@@ -404,8 +291,7 @@ def main():
                       VESCCodec.CAN_PACKET_STATUS_3,
                       VESCCodec.CAN_PACKET_STATUS_4,
                       VESCCodec.CAN_PACKET_STATUS_5]:
-            can_manager.register_callback(can_id, 
-                lambda data, cid=can_id: telemetry.on_can_message(cid, data))
+            can_manager.register_callback(can_id, telemetry.on_can_message)
         
         can_manager.start_receive_thread()
         print("CAN interface connected and listening")
@@ -419,8 +305,8 @@ def main():
     # Register TelemetryBridge as QML type
     qmlRegisterType(TelemetryBridge, "Telemetry", 1, 0, "TelemetryBridge")
     
-    # Expose telemetry bridge to QML
-    engine.rootContext().setContextProperty("telemetry", telemetry)
+    # Expose telemetry property map to QML
+    engine.rootContext().setContextProperty("telemetry", telemetry.telemetry_map)
     
     # Load main QML file
     qml_file = project_root / "ui" / "main.qml"
@@ -2,7 +2,7 @@
 Middleware package - CAN bus communication and VESC protocol decoding
 """
 
-from .can_manager import CANManager, CANInterface
-from .vesc_codec import VESCCodec, VESCStatus
+from .can_manager import CANManager
+from .vesc_codec import VESCCodec, VESCStatus, VESCStatusDict
 
-__all__ = ['CANManager', 'CANInterface', 'VESCCodec', 'VESCStatus']
+__all__ = ['CANManager', 'VESCCodec', 'VESCStatus', 'VESCStatusDict']
@@ -7,9 +7,26 @@ Targeting FSESC75200 (VESC 500k Bitrate)
 import can
 import struct
 import threading
+import time
+import numpy as np
 from typing import Optional, Callable, Dict
 from PySide6.QtCore import QObject, Signal
 
+# Precompiled payload layouts (big-endian)
+_STATUS1 = struct.Struct(">ihh")  # erpm, current x10, duty x1000
+_STATUS5_VOLTAGE = struct.Struct(">H")  # voltage x10 at offset 4
+
+# STATUS 1 frames are coalesced and emitted once per display frame (~60Hz)
+_DISPLAY_PERIOD = 0.016
+_STATUS1_BATCH = 64  # Max frames buffered per display frame
+
+# Kernel filter that matches no frame: requires bit 11 set on a standard ID
+_MATCH_NOTHING = {"can_id": 0x800, "can_mask": 0x800, "extended": False}
+
+# Precomputed reciprocals for raw -> engineering unit scaling
+_INV_10 = 0.1
+_INV_POLE_PAIRS = 1.0 / 7  # 7 pole pairs for 80100
+
 class CANManager(QObject):
     """
     HAL that handles the bridge between the physical CAN-SPI Click
@@ -21,6 +38,8 @@ class CANManager(QObject):
     current_changed = Signal(float)
     torque_changed = Signal(float)
     duty_changed = Signal(float)
+    # STATUS 1 (rpm, current, duty) averaged over each display frame, for smoothing
+    status1_mean_changed = Signal(float, float, float)
 
     def __init__(self, interface: str = "can0", virtual: bool = False):
         super().__init__()
@@ -29,9 +48,28 @@ class CANManager(QObject):
         self.bus: Optional[can.BusABC] = None
         self.running = False
         self.listener_thread: Optional[threading.Thread] = None
+        self.receiver_thread: Optional[threading.Thread] = None
+
+        # Per-ID callbacks for the dispatch receive path. The dict is never
+        # mutated in place: registration swaps in a new copy (copy-on-write)
+        # and bumps the version, so the receive loop can read it without a lock.
+        # The lock only serializes registrations against each other.
+        self.callbacks: Dict[int, Callable[[int, bytes], None]] = {}
+        self._callbacks_version = 0
+        self.lock = threading.Lock()
+
+        # STATUS 1 values buffered since the last display frame, stored as
+        # columns (erpm, current x10, duty x1000) for one vectorized pass
+        self._status1_ring = np.zeros((3, _STATUS1_BATCH), dtype=np.int32)
+        self._status1_count = 0
+
+        # Reused outgoing message, filled in place by send()
+        self._send_msg = can.Message(is_extended_id=True, data=bytearray(8))
+        self._send_lock = threading.Lock()
 
         # 130KV Motor Constant
         self.KT = 0.0735 
+        self._kt_per_current_x10 = self.KT * _INV_10
 
     def connect(self) -> bool:
         """Connects to the bus (SocketCAN on Pi, Virtual on Mac)"""
@@ -51,16 +89,106 @@ class CANManager(QObject):
             return False
 
     def start_listening(self):
-        """Starts the background thread to process VESC telemetry"""
+        """
+        Starts the background thread to process VESC telemetry.
+        Cannot be combined with start_receive_thread(): both read the same bus.
+        """
         if not self.bus:
             return
+        if self.receiver_thread is not None:
+            print("[CAN] Callback receive thread already running; not starting listener")
+            return
         self.listener_thread = threading.Thread(target=self._listen_loop, daemon=True)
         self.listener_thread.start()
 
+    def register_callback(self, can_id: int, callback: Callable[[int, bytes], None]):
+        """Registers a callback(can_id, data) for frames with the given arbitration ID"""
+        with self.lock:
+            callbacks = dict(self.callbacks)
+            callbacks[can_id] = callback
+            self.callbacks = callbacks
+            self._callbacks_version += 1
+            self._apply_filters()
+
+    def unregister_callback(self, can_id: int):
+        """Removes the callback registered for the given arbitration ID"""
+        with self.lock:
+            if can_id not in self.callbacks:
+                return
+            callbacks = dict(self.callbacks)
+            del callbacks[can_id]
+            self.callbacks = callbacks
+            self._callbacks_version += 1
+            self._apply_filters()
+
+    def _apply_filters(self):
+        """
+        Filters in the kernel (CAN_RAW_FILTER on SocketCAN) so only extended
+        frames with a registered ID wake this process. Only applied once the
+        callback receive thread owns the bus.
+        """
+        if not self.bus or self.receiver_thread is None:
+            return
+        # An empty filter list means "accept everything" to python-can
+        filters = [
+            {"can_id": can_id, "can_mask": 0x1FFFFFFF, "extended": True}
+            for can_id in self.callbacks
+        ] or [_MATCH_NOTHING]
+        self.bus.set_filters(filters)
+
+    def start_receive_thread(self):
+        """
+        Starts the background thread that dispatches frames to registered callbacks.
+        Cannot be combined with start_listening(): both read the same bus, and
+        the callback ID filters would drop the frames the listener decodes.
+        """
+        if not self.bus:
+            return
+        if self.listener_thread is not None:
+            print("[CAN] Listener thread already running; not starting callback receive thread")
+            return
+        self.receiver_thread = threading.Thread(target=self._receive_loop, daemon=True)
+        with self.lock:
+            self._apply_filters()
+        self.receiver_thread.start()
+
+    def _receive_loop(self):
+        """Dispatches incoming frames to the callback registered for their ID"""
+        version = -1
+        callbacks: Dict[int, Callable[[int, bytes], None]] = {}
+        while self.running:
+            msg = self.bus.recv(timeout=1.0)
+            if msg is None:
+                continue
+
+            # Pick up the new dict only after a registration. Checked after
+            # recv() returns, so registrations made while it was blocked
+            # already apply to this frame.
+            if version != self._callbacks_version:
+                version = self._callbacks_version
+                callbacks = self.callbacks
+
+            can_id = msg.arbitration_id
+            callback = callbacks.get(can_id)
+            if callback is not None:
+                callback(can_id, msg.data)
+
     def _listen_loop(self):
         """Processes incoming VESC Extended 29-bit CAN frames"""
+        next_flush = time.monotonic() + _DISPLAY_PERIOD
         while self.running:
-            msg = self.bus.recv(timeout=1.0)
+            # Wake up in time to flush buffered STATUS 1 frames
+            if self._status1_count:
+                timeout = max(0.0, next_flush - time.monotonic())
+            else:
+                timeout = 1.0
+            msg = self.bus.recv(timeout=timeout)
+
+            now = time.monotonic()
+            if now >= next_flush:
+                self._flush_status1()
+                next_flush = now + _DISPLAY_PERIOD
+
             if msg is None:
                 continue
 
@@ -70,21 +198,68 @@ class CANManager(QObject):
 
             # STATUS 1: ERPM, Current, Duty Cycle
             if packet_id == 0x09:
-                erpm, current_x10, duty_x1000 = struct.unpack(">ihh", msg.data[:8])
-                rpm = erpm / 7 # 7 pole pairs for 80100
-                current = current_x10 / 10.0
-                torque = current * self.KT
+                data = msg.data
+                if len(data) < 8:
+                    continue
+                erpm, current_x10, duty_x1000 = _STATUS1.unpack_from(data, 0)
 
-                self.rpm_changed.emit(int(rpm))
-                self.current_changed.emit(current)
-                self.torque_changed.emit(round(torque, 2))
-                self.duty_changed.emit(duty_x1000 / 10.0)
+                ring = self._status1_ring
+                i = self._status1_count
+                ring[0, i] = erpm
+                ring[1, i] = current_x10
+                ring[2, i] = duty_x1000
+                self._status1_count = i + 1
+                if self._status1_count == _STATUS1_BATCH:
+                    self._flush_status1()
 
             # STATUS 5: Voltage, Tachometer
             elif packet_id == 0x1B:
                 # Voltage is located at offset 4 (2 bytes unsigned short)
-                voltage_x10 = struct.unpack_from(">H", msg.data, 4)[0]
-                self.voltage_changed.emit(voltage_x10 / 10.0)
+                data = msg.data
+                if len(data) < 6:
+                    continue
+                voltage_x10 = _STATUS5_VOLTAGE.unpack_from(data, 4)[0]
+                self.voltage_changed.emit(voltage_x10 * _INV_10)
+
+    def _flush_status1(self):
+        """
+        Emits the latest buffered STATUS 1 values, plus their mean over the
+        buffered frames for smoothing
+        """
+        n = self._status1_count
+        if not n:
+            return
+        self._status1_count = 0
+
+        ring = self._status1_ring
+        erpm, current_x10, duty_x1000 = ring[:, n - 1].tolist()
+        # One vectorized pass over all three columns
+        mean_erpm, mean_current_x10, mean_duty_x1000 = ring[:, :n].mean(axis=1).tolist()
+
+        # Unrounded - display formatting is left to the UI
+        self.rpm_changed.emit(int(erpm * _INV_POLE_PAIRS))
+        self.current_changed.emit(current_x10 * _INV_10)
+        self.torque_changed.emit(current_x10 * self._kt_per_current_x10)
+        self.duty_changed.emit(duty_x1000 * _INV_10)
+        self.status1_mean_changed.emit(mean_erpm * _INV_POLE_PAIRS,
+                                       mean_current_x10 * _INV_10,
+                                       mean_duty_x1000 * _INV_10)
+
+    def send(self, can_id: int, data: bytes) -> bool:
+        """Sends an extended-ID frame with up to 8 bytes of payload"""
+        if not self.bus:
+            return False
+        with self._send_lock:
+            msg = self._send_msg
+            msg.arbitration_id = can_id
+            msg.data[:] = data[:8]
+            msg.dlc = len(msg.data)
+            try:
+                self.bus.send(msg)
+            except can.CanError as e:
+                print(f"[CAN] Send Error: {e}")
+                return False
+        return True
 
     def inject_mock_data(self, can_id: int, data: bytes):
         """Helper for Team B to simulate packets on Mac"""
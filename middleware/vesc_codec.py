@@ -4,12 +4,40 @@ Implements bit-shifting and parsing for VESC Status packets according to
 VESC CAN protocol specification.
 """
 
+import sys
 import struct
-from typing import Dict, Any, Optional
-from dataclasses import dataclass
+import numpy as np
+from collections.abc import Mapping
+from typing import Dict, Any, Iterator, Optional
+from dataclasses import dataclass, field, fields
 
 
-@dataclass
+# Precompiled payload layouts (little-endian) for each status frame
+_S1 = struct.Struct("<hhhh")  # temp_mos, current_motor, current_battery, duty
+_S2 = struct.Struct("<iHxx")  # rpm, voltage
+_S34 = struct.Struct("<ii")  # consumed, charged (Ah or Wh)
+_S5 = struct.Struct("<iI")  # tachometer, tachometer_abs
+
+# Structured views of the same layouts, for batch decoding of (N, 8) payloads
+_DT1 = np.dtype([("temp_mos", "<i2"), ("current_motor", "<i2"),
+                 ("current_battery", "<i2"), ("duty", "<i2")])
+_DT2 = np.dtype([("rpm", "<i4"), ("voltage", "<u2"), ("_", "<u2")])
+_DT34 = np.dtype([("consumed", "<i4"), ("charged", "<i4")])
+_DT5 = np.dtype([("tachometer", "<i4"), ("tachometer_abs", "<u4")])
+
+# Fixed-point scale factors used by the status frames
+_INV_10 = 0.1
+_INV_10000 = 0.0001
+
+# Duty (0.1% units, 0-1000) -> duty cycle, indexed instead of multiplied
+_DUTY_LUT = tuple(i * 0.001 for i in range(1001))
+
+# VESCStatus is created per CAN frame - use __slots__ where dataclasses
+# support it (Python 3.10+) to skip the per-instance __dict__
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class VESCStatus:
     """Decoded VESC Status data structure"""
     # Motor controller state
@@ -28,9 +56,102 @@ class VESCStatus:
     tachometer_abs: int = 0  # Absolute tachometer value
     fault_code: int = 0  # Fault code (0 = no fault)
     
-    # Calculated/derived values
-    power: float = 0.0  # Instantaneous power (W)
-    efficiency: float = 0.0  # Efficiency estimate (%)
+    # Bitmask of STATUS_*_VALID flags for the frames whose fields are set
+    valid_mask: int = field(default=0, repr=False, compare=False)
+    
+    # Equality compares values at the precision the dashboard displays them,
+    # so consumers can skip publishing a status that would look identical
+    def _display_key(self) -> tuple:
+        """Telemetry values rounded to display precision"""
+        return tuple(
+            getattr(self, name) if digits is None else round(getattr(self, name), digits)
+            for name, digits in _DISPLAY_FIELDS
+        )
+    
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._display_key() == other._display_key()
+    
+    # Mutable (decoders write into it in place), so not hashable
+    __hash__ = None
+    
+    # Calculated/derived values - computed on access
+    @property
+    def power(self) -> float:
+        """Instantaneous power (W)"""
+        return self.voltage * self.current_battery
+    
+    @property
+    def efficiency(self) -> float:
+        """Efficiency estimate (%)"""
+        power = self.power
+        if power > 0:
+            return (self.current_motor * self.voltage) / power * 100.0
+        return 0.0
+
+
+# Decimal places each field is displayed with (see ui/*.qml); VESCStatus
+# equality rounds to these. Fields not listed are compared exactly.
+_DISPLAY_PRECISION = {
+    "temp_mos": 1,
+    "temp_motor": 1,
+    "current_motor": 2,
+    "current_battery": 2,
+    "duty_cycle": 3,
+    "voltage": 2,
+    "amp_hours_consumed": 3,
+    "amp_hours_charged": 3,
+    "watt_hours_consumed": 2,
+    "watt_hours_charged": 2,
+}
+
+# (field name, display precision) for every compared VESCStatus field
+_DISPLAY_FIELDS = tuple(
+    (f.name, _DISPLAY_PRECISION.get(f.name)) for f in fields(VESCStatus) if f.compare
+)
+
+
+# Validity flags, one per status frame type
+STATUS_1_VALID = 1 << 0
+STATUS_2_VALID = 1 << 1
+STATUS_3_VALID = 1 << 2
+STATUS_4_VALID = 1 << 3
+STATUS_5_VALID = 1 << 4
+
+# Telemetry field names in declaration order plus derived values, for status_to_dict
+_STATUS_FIELDS = tuple(f.name for f in fields(VESCStatus) if f.name != "valid_mask") + (
+    "power", "efficiency")
+_STATUS_FIELD_SET = frozenset(_STATUS_FIELDS)
+
+
+class VESCStatusDict(Mapping):
+    """
+    Read-only dict view of a VESCStatus.
+    Lookups are forwarded to the underlying status, so no per-call dict is
+    built; values follow the status as it is updated.
+    """
+    
+    __slots__ = ("_status",)
+    
+    def __init__(self, status: VESCStatus):
+        self._status = status
+    
+    def __getitem__(self, key: str) -> Any:
+        if key not in _STATUS_FIELD_SET:
+            raise KeyError(key)
+        return getattr(self._status, key)
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(_STATUS_FIELDS)
+    
+    def __len__(self) -> int:
+        return len(_STATUS_FIELDS)
+    
+    def to_dict_copy(self) -> Dict[str, Any]:
+        """Snapshot the current values into a plain dict (e.g. for JSON)"""
+        status = self._status
+        return {name: getattr(status, name) for name in _STATUS_FIELDS}
 
 
 class VESCCodec:
@@ -47,56 +168,115 @@ class VESCCodec:
     CAN_PACKET_STATUS_5 = 0x000006
     
     def __init__(self):
-        self.status_cache: Dict[int, bytes] = {}  # Cache for multi-frame status packets
+        # CAN ID -> frame decoder
+        self._dispatch = {
+            self.CAN_PACKET_STATUS: self._decode_status_1,
+            self.CAN_PACKET_STATUS_2: self._decode_status_2,
+            self.CAN_PACKET_STATUS_3: self._decode_status_3,
+            self.CAN_PACKET_STATUS_4: self._decode_status_4,
+            self.CAN_PACKET_STATUS_5: self._decode_status_5,
+        }
     
-    def decode_status_frame(self, can_id: int, data: bytes) -> Optional[VESCStatus]:
+    def decode_status_frame(self, can_id: int, data: bytes,
+                            out: Optional[VESCStatus] = None) -> Optional[VESCStatus]:
         """
         Decode VESC Status Frame from CAN message
         
         Args:
             can_id: CAN message ID
             data: 8-byte CAN payload
+            out: Existing VESCStatus to decode into (default: a new one)
             
         Returns:
             VESCStatus object if decoding successful, None otherwise
         """
-        if can_id == self.CAN_PACKET_STATUS:
-            return self._decode_status_1(data)
-        elif can_id == self.CAN_PACKET_STATUS_2:
-            return self._decode_status_2(data)
-        elif can_id == self.CAN_PACKET_STATUS_3:
-            return self._decode_status_3(data)
-        elif can_id == self.CAN_PACKET_STATUS_4:
-            return self._decode_status_4(data)
-        elif can_id == self.CAN_PACKET_STATUS_5:
-            return self._decode_status_5(data)
+        decoder = self._dispatch.get(can_id)
+        if decoder is None or len(data) < 8:
+            return None
+        if out is None:
+            out = VESCStatus()
+        decoder(data, out)
+        return out
+    
+    def decode_into(self, can_id: int, data: bytes, status: VESCStatus) -> bool:
+        """
+        Decode a status frame into an existing VESCStatus without allocating.
+        Only the fields carried by this frame (and its valid_mask bit) are
+        written, so one status object reused for every frame always holds
+        the latest merged telemetry.
         
-        return None
+        Args:
+            can_id: CAN message ID
+            data: 8-byte CAN payload
+            status: VESCStatus to update in place
+            
+        Returns:
+            True if a complete VESC status frame was decoded, False otherwise
+        """
+        decoder = self._dispatch.get(can_id)
+        if decoder is None or len(data) < 8:
+            return False
+        decoder(data, status)
+        return True
+    
+    def decode_status_batch(self, can_ids: np.ndarray, data: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Decode many status frames at once (e.g. logged or replayed telemetry)
+        
+        Args:
+            can_ids: (N,) array of CAN message IDs
+            data: (N, 8) uint8 array of CAN payloads, row i belonging to can_ids[i]
+            
+        Returns:
+            Dictionary of VESCStatus field name -> array of scaled values, one
+            entry per frame of the type carrying that field, in arrival order
+        """
+        can_ids = np.asarray(can_ids)
+        data = np.ascontiguousarray(data, dtype=np.uint8).reshape(-1, 8)
+        
+        s1 = data[can_ids == self.CAN_PACKET_STATUS].view(_DT1)[:, 0]
+        s2 = data[can_ids == self.CAN_PACKET_STATUS_2].view(_DT2)[:, 0]
+        s3 = data[can_ids == self.CAN_PACKET_STATUS_3].view(_DT34)[:, 0]
+        s4 = data[can_ids == self.CAN_PACKET_STATUS_4].view(_DT34)[:, 0]
+        s5 = data[can_ids == self.CAN_PACKET_STATUS_5].view(_DT5)[:, 0]
+        
+        return {
+            "temp_mos": s1["temp_mos"] * _INV_10,
+            "current_motor": s1["current_motor"] * _INV_10,
+            "current_battery": s1["current_battery"] * _INV_10,
+            "duty_cycle": s1["duty"] * 0.001,
+            "rpm": s2["rpm"].astype(np.int64),
+            "voltage": s2["voltage"] * _INV_10,
+            "amp_hours_consumed": s3["consumed"] * _INV_10000,
+            "amp_hours_charged": s3["charged"] * _INV_10000,
+            "watt_hours_consumed": s4["consumed"] * _INV_10000,
+            "watt_hours_charged": s4["charged"] * _INV_10000,
+            "tachometer": s5["tachometer"].astype(np.int64),
+            "tachometer_abs": s5["tachometer_abs"].astype(np.int64),
+        }
     
-    def _decode_status_1(self, data: bytes) -> VESCStatus:
+    def _decode_status_1(self, data: bytes, out: VESCStatus) -> None:
         """
         Decode Status Frame 1 (Primary telemetry)
         Byte layout (little-endian):
         0-1:   temp_mos (int16, 0.1°C units)
         2-3:   current_motor (int16, 0.1A units)
         4-5:   current_battery (int16, 0.1A units)
-        6:     duty_cycle (int8, 0.1% units, 0-1000)
-        7:     reserved
+        6-7:   duty_cycle (int16, 0.1% units, 0-1000)
         """
-        if len(data) < 8:
-            return VESCStatus()
-        
-        temp_mos_raw, current_motor_raw, current_battery_raw, duty_raw = struct.unpack("<hhhBx", data)
+        temp_mos_raw, current_motor_raw, current_battery_raw, duty_raw = _S1.unpack_from(data, 0)
         
-        status = VESCStatus()
-        status.temp_mos = temp_mos_raw * 0.1
-        status.current_motor = current_motor_raw * 0.1
-        status.current_battery = current_battery_raw * 0.1
-        status.duty_cycle = duty_raw * 0.001  # Convert 0-1000 to 0.0-1.0
-        
-        return status
+        out.temp_mos = temp_mos_raw * _INV_10
+        out.current_motor = current_motor_raw * _INV_10
+        out.current_battery = current_battery_raw * _INV_10
+        # 0.1% units to 0.0-1.0 (negative duty falls back to the multiply)
+        if 0 <= duty_raw <= 1000:
+            out.duty_cycle = _DUTY_LUT[duty_raw]
+        else:
+            out.duty_cycle = duty_raw * 0.001
+        out.valid_mask |= STATUS_1_VALID
     
-    def _decode_status_2(self, data: bytes) -> VESCStatus:
+    def _decode_status_2(self, data: bytes, out: VESCStatus) -> None:
         """
         Decode Status Frame 2 (RPM and voltage)
         Byte layout:
@@ -104,150 +284,104 @@ class VESCCodec:
         4-5:   voltage (uint16, 0.1V units)
         6-7:   reserved
         """
-        if len(data) < 8:
-            return VESCStatus()
-        
-        rpm, voltage_raw = struct.unpack("<iHxx", data)
+        rpm, voltage_raw = _S2.unpack_from(data, 0)
         
-        status = VESCStatus()
-        status.rpm = rpm
-        status.voltage = voltage_raw * 0.1
-        
-        return status
+        out.rpm = rpm
+        out.voltage = voltage_raw * _INV_10
+        out.valid_mask |= STATUS_2_VALID
     
-    def _decode_status_3(self, data: bytes) -> VESCStatus:
+    def _decode_status_3(self, data: bytes, out: VESCStatus) -> None:
         """
         Decode Status Frame 3 (Energy consumption)
         Byte layout:
         0-3:   amp_hours_consumed (int32, 0.0001Ah units)
         4-7:   amp_hours_charged (int32, 0.0001Ah units)
         """
-        if len(data) < 8:
-            return VESCStatus()
-        
-        ah_consumed_raw, ah_charged_raw = struct.unpack("<ii", data)
+        ah_consumed_raw, ah_charged_raw = _S34.unpack_from(data, 0)
         
-        status = VESCStatus()
-        status.amp_hours_consumed = ah_consumed_raw * 0.0001
-        status.amp_hours_charged = ah_charged_raw * 0.0001
-        
-        return status
+        out.amp_hours_consumed = ah_consumed_raw * _INV_10000
+        out.amp_hours_charged = ah_charged_raw * _INV_10000
+        out.valid_mask |= STATUS_3_VALID
     
-    def _decode_status_4(self, data: bytes) -> VESCStatus:
+    def _decode_status_4(self, data: bytes, out: VESCStatus) -> None:
         """
         Decode Status Frame 4 (Energy and tachometer)
         Byte layout:
         0-3:   watt_hours_consumed (int32, 0.0001Wh units)
         4-7:   watt_hours_charged (int32, 0.0001Wh units)
         """
-        if len(data) < 8:
-            return VESCStatus()
-        
-        wh_consumed_raw, wh_charged_raw = struct.unpack("<ii", data)
+        wh_consumed_raw, wh_charged_raw = _S34.unpack_from(data, 0)
         
-        status = VESCStatus()
-        status.watt_hours_consumed = wh_consumed_raw * 0.0001
-        status.watt_hours_charged = wh_charged_raw * 0.0001
-        
-        return status
+        out.watt_hours_consumed = wh_consumed_raw * _INV_10000
+        out.watt_hours_charged = wh_charged_raw * _INV_10000
+        out.valid_mask |= STATUS_4_VALID
     
-    def _decode_status_5(self, data: bytes) -> VESCStatus:
+    def _decode_status_5(self, data: bytes, out: VESCStatus) -> None:
         """
         Decode Status Frame 5 (Tachometer and fault codes)
         Byte layout:
         0-3:   tachometer (int32, signed)
         4-7:   tachometer_abs (int32, unsigned)
         """
-        if len(data) < 8:
-            return VESCStatus()
-        
-        tachometer, tachometer_abs = struct.unpack("<iI", data)
+        tachometer, tachometer_abs = _S5.unpack_from(data, 0)
         
-        status = VESCStatus()
-        status.tachometer = tachometer
-        status.tachometer_abs = tachometer_abs
-        
-        return status
+        out.tachometer = tachometer
+        out.tachometer_abs = tachometer_abs
+        out.valid_mask |= STATUS_5_VALID
     
-    def merge_status_frames(self, *status_frames: VESCStatus) -> VESCStatus:
+    def merge_status_frames(self, f1: Optional[VESCStatus] = None,
+                            f2: Optional[VESCStatus] = None,
+                            f3: Optional[VESCStatus] = None,
+                            f4: Optional[VESCStatus] = None,
+                            f5: Optional[VESCStatus] = None) -> VESCStatus:
         """
         Merge multiple status frames into a single complete status object.
         VESC sends status data across multiple CAN frames, so we need to combine them.
         
         Args:
-            *status_frames: Variable number of VESCStatus objects to merge
+            f1-f5: Decoded STATUS 1-5 frames, or None if not yet received.
+                A frame whose valid_mask lacks its STATUS_N_VALID bit is ignored.
             
         Returns:
             Merged VESCStatus with all available data
         """
         merged = VESCStatus()
         
-        for frame in status_frames:
-            if frame is None:
-                continue
-            
-            # Merge non-zero/non-default values
-            if frame.temp_mos != 0.0:
-                merged.temp_mos = frame.temp_mos
-            if frame.temp_motor != 0.0:
-                merged.temp_motor = frame.temp_motor
-            if frame.current_motor != 0.0:
-                merged.current_motor = frame.current_motor
-            if frame.current_battery != 0.0:
-                merged.current_battery = frame.current_battery
-            if frame.duty_cycle != 0.0:
-                merged.duty_cycle = frame.duty_cycle
-            if frame.rpm != 0:
-                merged.rpm = frame.rpm
-            if frame.voltage != 0.0:
-                merged.voltage = frame.voltage
-            if frame.amp_hours_consumed != 0.0:
-                merged.amp_hours_consumed = frame.amp_hours_consumed
-            if frame.amp_hours_charged != 0.0:
-                merged.amp_hours_charged = frame.amp_hours_charged
-            if frame.watt_hours_consumed != 0.0:
-                merged.watt_hours_consumed = frame.watt_hours_consumed
-            if frame.watt_hours_charged != 0.0:
-                merged.watt_hours_charged = frame.watt_hours_charged
-            if frame.tachometer != 0:
-                merged.tachometer = frame.tachometer
-            if frame.tachometer_abs != 0:
-                merged.tachometer_abs = frame.tachometer_abs
-            if frame.fault_code != 0:
-                merged.fault_code = frame.fault_code
-        
-        # Calculate derived values
-        merged.power = merged.voltage * merged.current_battery
-        if merged.power > 0:
-            merged.efficiency = (merged.current_motor * merged.voltage) / merged.power * 100.0
+        # Each frame type only carries its own fields - copy those directly,
+        # if the frame actually holds valid data for that type
+        if f1 is not None and f1.valid_mask & STATUS_1_VALID:
+            merged.temp_mos = f1.temp_mos
+            merged.current_motor = f1.current_motor
+            merged.current_battery = f1.current_battery
+            merged.duty_cycle = f1.duty_cycle
+            merged.valid_mask |= STATUS_1_VALID
+        if f2 is not None and f2.valid_mask & STATUS_2_VALID:
+            merged.rpm = f2.rpm
+            merged.voltage = f2.voltage
+            merged.valid_mask |= STATUS_2_VALID
+        if f3 is not None and f3.valid_mask & STATUS_3_VALID:
+            merged.amp_hours_consumed = f3.amp_hours_consumed
+            merged.amp_hours_charged = f3.amp_hours_charged
+            merged.valid_mask |= STATUS_3_VALID
+        if f4 is not None and f4.valid_mask & STATUS_4_VALID:
+            merged.watt_hours_consumed = f4.watt_hours_consumed
+            merged.watt_hours_charged = f4.watt_hours_charged
+            merged.valid_mask |= STATUS_4_VALID
+        if f5 is not None and f5.valid_mask & STATUS_5_VALID:
+            merged.tachometer = f5.tachometer
+            merged.tachometer_abs = f5.tachometer_abs
+            merged.valid_mask |= STATUS_5_VALID
         
         return merged
     
-    def status_to_dict(self, status: VESCStatus) -> Dict[str, Any]:
+    def status_to_dict(self, status: VESCStatus) -> VESCStatusDict:
         """
-        Convert VESCStatus to dictionary for easy serialization/transmission
+        Expose VESCStatus as a read-only mapping for dict-style consumers
         
         Args:
             status: VESCStatus object
             
         Returns:
-            Dictionary representation
+            Read-only view over status (use .to_dict_copy() for a real dict)
         """
-        return {
-            "temp_mos": status.temp_mos,
-            "temp_motor": status.temp_motor,
-            "current_motor": status.current_motor,
-            "current_battery": status.current_battery,
-            "duty_cycle": status.duty_cycle,
-            "rpm": status.rpm,
-            "voltage": status.voltage,
-            "amp_hours_consumed": status.amp_hours_consumed,
-            "amp_hours_charged": status.amp_hours_charged,
-            "watt_hours_consumed": status.watt_hours_consumed,
-            "watt_hours_charged": status.watt_hours_charged,
-            "tachometer": status.tachometer,
-            "tachometer_abs": status.tachometer_abs,
-            "fault_code": status.fault_code,
-            "power": status.power,
-            "efficiency": status.efficiency,
-        }
+        return VESCStatusDict(status)
@@ -6,10 +6,25 @@ Allows testing the dashboard without physical hardware.
 import time
 import struct
 import math
-import random
+import numpy as np
 from typing import Callable, Optional
 
 
+# Precompiled payload layouts, matching VESCCodec's status frame decoders
+_S1 = struct.Struct("<hhhh")
+_S2 = struct.Struct("<iHxx")
+_S34 = struct.Struct("<ii")
+_S5 = struct.Struct("<iI")
+
+# Per-controller simulation state, one row per simulated VESC
+_STATE_DTYPE = np.dtype([
+    ("rpm", "f8"),
+    ("voltage", "f8"),
+    ("temp_mos", "f8"),
+    ("temp_motor", "f8"),
+])
+
+
 class VESCSimulator:
     """
     Simulates VESC motor controller behavior by generating realistic CAN packets.
@@ -23,12 +38,17 @@ class VESCSimulator:
     CAN_PACKET_STATUS_4 = 0x000005
     CAN_PACKET_STATUS_5 = 0x000006
     
-    def __init__(self, callback: Optional[Callable[[int, bytes], None]] = None):
+    def __init__(self, callback: Optional[Callable[[int, bytes], None]] = None,
+                 num_controllers: int = 1):
         """
         Initialize simulator
         
         Args:
-            callback: Function to call when generating packets (can_id, data)
+            callback: Function to call when generating packets (can_id, data).
+                data is a memoryview over a payload buffer that is rewritten
+                every tick - copy it (bytes(data)) to keep it
+            num_controllers: Number of VESCs to simulate (physics is vectorized
+                across them; packets are generated for the first one)
         """
         self.callback = callback
         self.running = False
@@ -37,10 +57,41 @@ class VESCSimulator:
         # Simulation state
         self.throttle = 0.0  # 0.0 to 1.0
         self.brake = 0.0  # 0.0 to 1.0
-        self.rpm = 0
-        self.voltage = 48.0  # Nominal battery voltage (adjust for your pack)
-        self.temp_mos = 25.0
-        self.temp_motor = 25.0
+        self._state = np.zeros(num_controllers, dtype=_STATE_DTYPE)
+        self._state["voltage"] = 48.0  # Nominal battery voltage (adjust for your pack)
+        self._state["temp_mos"] = 25.0
+        self._state["temp_motor"] = 25.0
+        self._rng = np.random.default_rng()
+        
+        # Preallocated 8-byte payload buffers, one per status frame, packed
+        # in place each tick
+        self._buf1 = bytearray(8)
+        self._buf2 = bytearray(8)
+        self._buf3 = bytearray(8)
+        self._buf4 = bytearray(8)
+        self._buf5 = bytearray(8)
+        self._mv1 = memoryview(self._buf1)
+        self._mv2 = memoryview(self._buf2)
+        self._mv3 = memoryview(self._buf3)
+        self._mv4 = memoryview(self._buf4)
+        self._mv5 = memoryview(self._buf5)
+    
+    # State of the first controller (the one packets are generated for)
+    @property
+    def rpm(self) -> float:
+        return float(self._state["rpm"][0])
+    
+    @property
+    def voltage(self) -> float:
+        return float(self._state["voltage"][0])
+    
+    @property
+    def temp_mos(self) -> float:
+        return float(self._state["temp_mos"][0])
+    
+    @property
+    def temp_motor(self) -> float:
+        return float(self._state["temp_motor"][0])
         
     def set_throttle(self, value: float):
         """Set throttle position (0.0 to 1.0)"""
@@ -61,63 +112,66 @@ class VESCSimulator:
         self.sim_time = 0.0
         
         period = 1.0 / update_rate
-        last_update = time.time()
+        next_deadline = time.perf_counter() + period
         
+        # Fixed-step scheduler: each tick advances the simulation by exactly
+        # one period and sleeps until the next deadline
         while self.running:
-            current_time = time.time()
-            dt = current_time - last_update
-            self.sim_time += dt
-            
-            if dt >= period:
-                self._update_physics(dt)
+            now = time.perf_counter()
+            if now >= next_deadline:
+                self.sim_time += period
+                self._update_physics(period)
                 self._generate_packets()
-                last_update = current_time
+                # After a stall (debugger pause, suspend, slow callback), drop
+                # the missed ticks instead of replaying them all back-to-back
+                if now - next_deadline > period:
+                    next_deadline = now
+                next_deadline += period
             else:
-                time.sleep(period - dt)
+                time.sleep(next_deadline - now)
     
     def stop(self):
         """Stop simulation"""
         self.running = False
     
     def _update_physics(self, dt: float):
-        """Update simulated physics state"""
+        """Update simulated physics state for all controllers at once"""
+        state = self._state
+        rpm = state["rpm"]
+        
         # Simple motor model for 80100 130KV motor
         # KV rating: 130 RPM per volt
-        max_rpm = self.voltage * 130  # Theoretical max RPM
+        max_rpm = state["voltage"] * 130  # Theoretical max RPM
         
         # Target RPM based on throttle (with some inertia)
         target_rpm = max_rpm * self.throttle * (1.0 - self.brake)
         
         # Smooth RPM change (simulate motor inertia)
-        rpm_diff = target_rpm - self.rpm
-        self.rpm += rpm_diff * dt * 5.0  # 5.0 is inertia factor
+        rpm += (target_rpm - rpm) * dt * 5.0  # 5.0 is inertia factor
         
         # Clamp RPM
-        self.rpm = max(0, min(self.rpm, max_rpm))
+        np.clip(rpm, 0, max_rpm, out=rpm)
         
         # Calculate currents based on RPM and load
         # Simplified model: current proportional to power demand
-        if self.rpm > 0:
-            # Motor current (simplified: higher RPM = more current)
-            motor_current = (self.rpm / max_rpm) * 50.0 * (1.0 + random.uniform(-0.1, 0.1))
-            # Battery current (accounting for efficiency losses)
-            battery_current = motor_current * 1.15  # ~85% efficiency
-        else:
-            motor_current = 0.0
-            battery_current = 0.0
+        # Motor current (simplified: higher RPM = more current)
+        noise = self._rng.uniform(-0.1, 0.1, size=len(state))
+        motor_current = np.where(rpm > 0, (rpm / max_rpm) * 50.0 * (1.0 + noise), 0.0)
+        # Battery current (accounting for efficiency losses)
+        battery_current = motor_current * 1.15  # ~85% efficiency
         
         # Temperature simulation (heating/cooling)
         # MOSFET temp based on current
-        target_mos_temp = 25.0 + abs(battery_current) * 2.0
-        self.temp_mos += (target_mos_temp - self.temp_mos) * dt * 0.5
+        target_mos_temp = 25.0 + np.abs(battery_current) * 2.0
+        state["temp_mos"] += (target_mos_temp - state["temp_mos"]) * dt * 0.5
         
         # Motor temp based on RPM and current
-        target_motor_temp = 25.0 + (self.rpm / 1000.0) * 5.0 + abs(motor_current) * 1.5
-        self.temp_motor += (target_motor_temp - self.temp_motor) * dt * 0.3
+        target_motor_temp = 25.0 + (rpm / 1000.0) * 5.0 + np.abs(motor_current) * 1.5
+        state["temp_motor"] += (target_motor_temp - state["temp_motor"]) * dt * 0.3
         
         # Voltage sag under load
         voltage_sag = battery_current * 0.1  # 0.1V per amp
-        self.voltage = 48.0 - voltage_sag + random.uniform(-0.2, 0.2)
+        state["voltage"] = 48.0 - voltage_sag + self._rng.uniform(-0.2, 0.2, size=len(state))
     
     def _generate_packets(self):
         """Generate and emit VESC status packets"""
@@ -135,13 +189,14 @@ class VESCSimulator:
         current_battery_raw = int(battery_current * 10)
         duty_raw = int(duty_cycle * 1000)
         
-        data1 = struct.pack("<hhhBx", temp_mos_raw, current_motor_raw, current_battery_raw, duty_raw)
-        self.callback(self.CAN_PACKET_STATUS, data1)
+        _S1.pack_into(self._buf1, 0, temp_mos_raw, current_motor_raw,
+                      current_battery_raw, duty_raw)
+        self.callback(self.CAN_PACKET_STATUS, self._mv1)
         
         # Status Frame 2: RPM, Voltage
         voltage_raw = int(self.voltage * 10)
-        data2 = struct.pack("<iHxx", int(self.rpm), voltage_raw)
-        self.callback(self.CAN_PACKET_STATUS_2, data2)
+        _S2.pack_into(self._buf2, 0, int(self.rpm), voltage_raw)
+        self.callback(self.CAN_PACKET_STATUS_2, self._mv2)
         
         # Status Frame 3: Ah consumed/charged (simplified - just increment)
         # In real scenario, these would be accumulated over time
@@ -149,24 +204,24 @@ class VESCSimulator:
         ah_charged = 0.0  # Not charging in this sim
         ah_consumed_raw = int(ah_consumed * 10000)
         ah_charged_raw = int(ah_charged * 10000)
-        data3 = struct.pack("<ii", ah_consumed_raw, ah_charged_raw)
-        self.callback(self.CAN_PACKET_STATUS_3, data3)
+        _S34.pack_into(self._buf3, 0, ah_consumed_raw, ah_charged_raw)
+        self.callback(self.CAN_PACKET_STATUS_3, self._mv3)
         
         # Status Frame 4: Wh consumed/charged
         wh_consumed = ah_consumed * self.voltage
         wh_charged = 0.0
         wh_consumed_raw = int(wh_consumed * 10000)
         wh_charged_raw = int(wh_charged * 10000)
-        data4 = struct.pack("<ii", wh_consumed_raw, wh_charged_raw)
-        self.callback(self.CAN_PACKET_STATUS_4, data4)
+        _S34.pack_into(self._buf4, 0, wh_consumed_raw, wh_charged_raw)
+        self.callback(self.CAN_PACKET_STATUS_4, self._mv4)
         
         # Status Frame 5: Tachometer
         # Tachometer = RPM * pole_pairs / 60 (simplified)
         pole_pairs = 7  # Typical for 80100 motor
         tachometer = int((self.rpm * pole_pairs) / 60.0 * self.sim_time)
         tachometer_abs = abs(tachometer)
-        data5 = struct.pack("<iI", tachometer, tachometer_abs)
-        self.callback(self.CAN_PACKET_STATUS_5, data5)
+        _S5.pack_into(self._buf5, 0, tachometer, tachometer_abs)
+        self.callback(self.CAN_PACKET_STATUS_5, self._mv5)
     
     def generate_test_sequence(self, duration: float = 10.0):
         """
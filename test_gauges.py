@@ -22,6 +22,62 @@ from PySide6.QtGui import QGuiApplication
 from PySide6.QtQml import QQmlApplicationEngine
 
 from main import TelemetryBridge
+from middleware.vesc_codec import VESCStatus
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """No-op stand-in so the tester still runs without Numba"""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def _wave_values(t, cycle_duration):
+    """
+    Compute all animated telemetry values for time t in one call
+    (compiled with Numba when available, plain Python otherwise)
+    """
+    # Normalize time to 0-1 range for one cycle
+    cycle_progress = (t % cycle_duration) / cycle_duration
+    
+    # Use sine wave for smooth back-and-forth motion (0 -> 1 -> 0)
+    # This creates a more realistic "driving" feel
+    wave = (math.sin(cycle_progress * 2 * math.pi - math.pi / 2) + 1) / 2
+    
+    # RPM: Full range 0-6000 for dramatic gauge animation
+    rpm = int(wave * 6000)
+    
+    # Voltage: 48-54V (typical for 48V system under load)
+    voltage = 48 + (wave * 6)
+    
+    # Motor Current: 0-200A
+    current_motor = wave * 200
+    
+    # Battery Current: sized so the derived efficiency (motor / battery
+    # current) sweeps 75-95% (realistic range)
+    current_battery = current_motor / (0.75 + wave * 0.2)
+    
+    # MOSFET Temperature: 25-95°C (ambient to hot)
+    temp_mos = 25 + (wave * 70)
+    
+    # Motor temperature (not displayed but needed for VESCStatus)
+    temp_motor = 25 + (wave * 60)
+    
+    # Duty Cycle: 0-100%
+    duty_cycle = wave
+    
+    # Energy consumed: slowly increasing
+    amp_hours_consumed = t * 0.1
+    watt_hours_consumed = t * 5
+    
+    # Tachometer: correlates with RPM
+    tachometer = int(t * 100)
+    
+    return (rpm, voltage, current_motor, current_battery, temp_mos, temp_motor,
+            duty_cycle, amp_hours_consumed, watt_hours_consumed, tachometer)
 
 
 class GaugeTester(QObject):
@@ -36,11 +92,10 @@ class GaugeTester(QObject):
         
         # Connect to a signal to verify updates are working
         if self.debug:
-            self.telemetry.speedChanged.connect(
-                lambda v: print(f"[DEBUG] Speed changed signal received: {v:.1f} km/h")
-            )
-            self.telemetry.rpmChanged.connect(
-                lambda v: print(f"[DEBUG] RPM changed signal received: {v}")
+            values = self.telemetry.telemetry_map
+            self.telemetry.telemetryChanged.connect(
+                lambda: print(f"[DEBUG] Telemetry changed signal received: "
+                              f"{values.value('speed'):.1f} km/h, {values.value('rpm')} rpm")
             )
         
         # Setup timer for smooth animation (60 FPS)
@@ -53,67 +108,39 @@ class GaugeTester(QObject):
         # Increment time
         self.time += 0.016  # 16ms per frame
         
-        # Normalize time to 0-1 range for one cycle
-        cycle_progress = (self.time % self.cycle_duration) / self.cycle_duration
-        
-        # Use sine wave for smooth back-and-forth motion (0 -> 1 -> 0)
-        # This creates a more realistic "driving" feel
-        wave = (math.sin(cycle_progress * 2 * math.pi - math.pi / 2) + 1) / 2
+        (rpm, voltage, current_motor, current_battery, temp_mos, temp_motor,
+         duty_cycle, amp_hours_consumed, watt_hours_consumed,
+         tachometer) = _wave_values(self.time, self.cycle_duration)
         
         # Create a mock VESC status with calculated values
-        from middleware.vesc_codec import VESCStatus
-        
-        # Calculate values based on wave position
-        status = VESCStatus()
-        
-        # RPM: Full range 0-6000 for dramatic gauge animation
-        status.rpm = int(wave * 6000)
-        
-        # Voltage: 48-54V (typical for 48V system under load)
-        status.voltage = 48 + (wave * 6)
-        
-        # Motor Current: 0-200A
-        status.current_motor = wave * 200
-        
-        # Battery Current: 0-200A (similar to motor current)
-        status.current_battery = wave * 195
-        
-        # Power: calculated from voltage and current
-        status.power = status.voltage * status.current_motor
-        
-        # MOSFET Temperature: 25-95°C (ambient to hot)
-        status.temp_mos = 25 + (wave * 70)
-        
-        # Motor temperature (not displayed but needed for VESCStatus)
-        status.temp_motor = 25 + (wave * 60)
-        
-        # Duty Cycle: 0-100%
-        status.duty_cycle = wave
-        
-        # Efficiency: 75-95% (realistic range)
-        status.efficiency = 75 + (wave * 20)
-        
-        # Energy consumed: slowly increasing
-        status.amp_hours_consumed = self.time * 0.1
-        status.amp_hours_charged = 0
-        status.watt_hours_consumed = self.time * 5
-        status.watt_hours_charged = 0
-        
-        # Tachometer: correlates with RPM
-        status.tachometer = int(self.time * 100)
-        status.tachometer_abs = int(self.time * 100)
-        
-        # Fault code: 0 = no fault
-        status.fault_code = 0
+        # (power and efficiency are derived by VESCStatus from these)
+        status = VESCStatus(
+            temp_mos=temp_mos,
+            temp_motor=temp_motor,
+            current_motor=current_motor,
+            current_battery=current_battery,
+            duty_cycle=duty_cycle,
+            rpm=rpm,
+            voltage=voltage,
+            amp_hours_consumed=amp_hours_consumed,
+            amp_hours_charged=0,
+            watt_hours_consumed=watt_hours_consumed,
+            watt_hours_charged=0,
+            tachometer=tachometer,
+            tachometer_abs=tachometer,
+            fault_code=0,  # 0 = no fault
+        )
         
         # Update telemetry bridge using the proper method
         self.telemetry.update_from_status(status)
         
         # Print current status every second
         if int(self.time * 10) % 10 == 0:
-            print(f"Progress: {cycle_progress*100:.1f}% | Speed: {self.telemetry.speed:.1f} km/h | "
-                  f"RPM: {self.telemetry.rpm} | Voltage: {self.telemetry.voltage:.1f}V | "
-                  f"Current: {self.telemetry.currentMotor:.1f}A | Temp: {self.telemetry.tempMos:.1f}°C")
+            values = self.telemetry.telemetry_map
+            cycle_progress = (self.time % self.cycle_duration) / self.cycle_duration
+            print(f"Progress: {cycle_progress*100:.1f}% | Speed: {values.value('speed'):.1f} km/h | "
+                  f"RPM: {values.value('rpm')} | Voltage: {values.value('voltage'):.1f}V | "
+                  f"Current: {values.value('currentMotor'):.1f}A | Temp: {values.value('tempMos'):.1f}°C")
 
 
 def main():
@@ -138,8 +165,8 @@ def main():
     # Add project root to QML import path so "import ui 1.0" can find ui/qmldir
     engine.addImportPath(str(project_root))
     
-    # Expose telemetry bridge to QML
-    engine.rootContext().setContextProperty("telemetry", telemetry)
+    # Expose telemetry property map to QML
+    engine.rootContext().setContextProperty("telemetry", telemetry.telemetry_map)
     
     # Load main QML file
     qml_file = project_root / "ui" / "main.qml"
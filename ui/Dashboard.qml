@@ -11,48 +11,20 @@ Item {
     // Theme reference
     readonly property var theme: Theme
     
-    // Telemetry object passed from main.qml
+    // Telemetry property map passed from main.qml
     property var telemetry: null
     
-    // Telemetry data (mutable properties that update from signals)
-    property real speed: 0.0
-    property int rpm: 0
-    property real voltage: 0.0
-    property real currentMotor: 0.0
-    property real currentBattery: 0.0
-    property real power: 0.0
-    property real tempMos: 0.0
-    property real dutyCycle: 0.0
-    property real efficiency: 0.0
-    
-    // Connect to telemetry signals when telemetry object is available
-    Connections {
-        target: telemetry
-        function onSpeedChanged(value) { speed = value }
-        function onRpmChanged(value) { rpm = value }
-        function onVoltageChanged(value) { voltage = value }
-        function onCurrentMotorChanged(value) { currentMotor = value }
-        function onCurrentBatteryChanged(value) { currentBattery = value }
-        function onPowerChanged(value) { power = value }
-        function onTempMosChanged(value) { tempMos = value }
-        function onDutyCycleChanged(value) { dutyCycle = value }
-        function onEfficiencyChanged(value) { efficiency = value }
-    }
-    
-    // Initialize values from telemetry if available
-    Component.onCompleted: {
-        if (telemetry) {
-            speed = telemetry.speed
-            rpm = telemetry.rpm
-            voltage = telemetry.voltage
-            currentMotor = telemetry.currentMotor
-            currentBattery = telemetry.currentBattery
-            power = telemetry.power
-            tempMos = telemetry.tempMos
-            dutyCycle = telemetry.dutyCycle
-            efficiency = telemetry.efficiency
-        }
-    }
+    // Telemetry data (bound to the telemetry property map; QML re-evaluates
+    // only the bindings whose keys changed)
+    readonly property real speed: telemetry ? telemetry.speed : 0.0
+    readonly property int rpm: telemetry ? telemetry.rpm : 0
+    readonly property real voltage: telemetry ? telemetry.voltage : 0.0
+    readonly property real currentMotor: telemetry ? telemetry.currentMotor : 0.0
+    readonly property real currentBattery: telemetry ? telemetry.currentBattery : 0.0
+    readonly property real power: telemetry ? telemetry.power : 0.0
+    readonly property real tempMos: telemetry ? telemetry.tempMos : 0.0
+    readonly property real dutyCycle: telemetry ? telemetry.dutyCycle : 0.0
+    readonly property real efficiency: telemetry ? telemetry.efficiency : 0.0
     
     // Automotive-grade black background
     Rectangle {